@@ -2,17 +2,17 @@ import pandas as pd
 import warnings
 from datetime import timedelta
 
-def validate_health_data(csv_path='output/merged_health_data.csv'):
+def validate_health_data(data_path='output/merged_health_data.parquet'):
     """
     Validate and analyze the merged health dataset.
-    
+
     Args:
-        csv_path (str): Path to the merged health data CSV file
+        data_path (str): Path to the merged health data Parquet file
     """
-    # Load the dataset
+    # Load the dataset; Parquet preserves the datetime dtype so no re-parse
+    # of the timestamp column is needed
     print("Loading dataset...")
-    df = pd.read_csv(csv_path)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    df = pd.read_parquet(data_path)
     
     print("\n=== Dataset Validation ===")
     
@@ -7,10 +7,11 @@ import json
 from plotly.subplots import make_subplots
 
 class HealthDataVisualizer:
-    def __init__(self, data_path="output/merged_health_data.csv"):
+    def __init__(self, data_path="output/merged_health_data.parquet"):
         print("Loading data...")
-        self.df = pd.read_csv(data_path, low_memory=False)
-        self.df['timestamp'] = pd.to_datetime(self.df['timestamp'])
+        # Parquet preserves the datetime dtype so no re-parse of the
+        # timestamp column is needed
+        self.df = pd.read_parquet(data_path)
         
         # Debug information
         print("\nAvailable columns:")